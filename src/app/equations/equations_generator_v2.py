@@ -105,6 +105,8 @@ class EquationsGeneratorV2:
         """Initialize the equation generator with default values."""
         self.variables = list("xyzwvu")
         self.operations = ["+", "-", "*", "/"]
+        # SymPy symbols for the variables, created once and shared by every generated quiz
+        self.symbols = [sp.Symbol(var) for var in self.variables]
 
     def generate_basic_math(
         self,
@@ -113,6 +115,7 @@ class EquationsGeneratorV2:
         allow_decimals: bool = False,
         elements: int = 2,
         random_seed: int | None = None,
+        rng: random.Random | None = None,
     ) -> DynamicQuizV2:
         """
         Generate a basic math equation with one unknown on the left side.
@@ -123,6 +126,7 @@ class EquationsGeneratorV2:
             allow_decimals: Whether to allow decimal values, defaults to False
             elements: Number of elements in the equation, defaults to 2 (x = a + b)
             random_seed: Optional random seed for reproducibility
+            rng: Optional random number generator to draw from, overrides random_seed
 
         Returns:
             DynamicQuizV2: The generated quiz with equations and solution
@@ -131,12 +135,12 @@ class EquationsGeneratorV2:
         if operations is None:
             operations = ["+", "-"]
 
-        # Set random seed if provided
-        if random_seed is not None:
-            random.seed(random_seed)
+        # Use a private generator so seeding never touches the global random state
+        if rng is None:
+            rng = random.Random(random_seed)
 
-        # Create the variable symbol
-        x = sp.Symbol("x")
+        # Use the first variable symbol (x)
+        x = self.symbols[0]
 
         # Build the right side of the equation
         right_side_expr = None
@@ -144,9 +148,9 @@ class EquationsGeneratorV2:
 
         # Start with a random value for the first element
         if allow_decimals:
-            first_value = round(random.uniform(1, max_value), 1)
+            first_value = round(rng.uniform(1, max_value), 1)
         else:
-            first_value = random.randint(1, max_value)
+            first_value = rng.randint(1, max_value)
 
         right_side_expr = first_value
         right_side_formatted = str(first_value)
@@ -154,13 +158,13 @@ class EquationsGeneratorV2:
         # Add additional elements based on the specified number
         for i in range(elements - 1):
             # Choose a random operation from the allowed operations
-            operation = random.choice(operations)
+            operation = rng.choice(operations)
 
             # Generate a random value for the operand
             if allow_decimals:
-                operand_value = round(random.uniform(1, max_value), 1)
+                operand_value = round(rng.uniform(1, max_value), 1)
             else:
-                operand_value = random.randint(1, max_value)
+                operand_value = rng.randint(1, max_value)
 
             # Apply the operation to the right side expression
             if operation == "+":
@@ -189,7 +193,7 @@ class EquationsGeneratorV2:
                         right_side_formatted += f" * {operand_value}"
                         continue
 
-                    operand_value = random.choice(divisors)
+                    operand_value = rng.choice(divisors)
 
                 right_side_expr /= operand_value
                 right_side_formatted += f" / {operand_value}"
@@ -214,7 +218,11 @@ class EquationsGeneratorV2:
         )
 
     def generate_simple_quiz(
-        self, num_unknowns: int = 2, max_value: int = 20, random_seed: int | None = None
+        self,
+        num_unknowns: int = 2,
+        max_value: int = 20,
+        random_seed: int | None = None,
+        rng: random.Random | None = None,
     ) -> DynamicQuizV2:
         """
         Generate a simple quiz with multiple unknowns and integer solutions.
@@ -228,21 +236,22 @@ class EquationsGeneratorV2:
             num_unknowns: Number of unknown variables, defaults to 2
             max_value: Maximum value for constants, defaults to 20
             random_seed: Optional random seed for reproducibility
+            rng: Optional random number generator to draw from, overrides random_seed
 
         Returns:
             DynamicQuizV2: The generated quiz with equations and solution
         """
-        # Set random seed if provided
-        if random_seed is not None:
-            random.seed(random_seed)
+        # Use a private generator so seeding never touches the global random state
+        if rng is None:
+            rng = random.Random(random_seed)
 
-        # Create the variable symbols
-        var_symbols = [sp.Symbol(var) for var in self.variables[:num_unknowns]]
+        # Take the variable symbols for the requested number of unknowns
+        var_symbols = self.symbols[:num_unknowns]
 
         # Generate random integer solutions for each variable
         solution_values = {}
         for var in var_symbols:
-            solution_values[var] = random.randint(1, max_value)
+            solution_values[var] = rng.randint(1, max_value)
 
         # Create human-readable solution dictionary
         human_readable_solution = {str(var): value for var, value in solution_values.items()}
@@ -253,11 +262,11 @@ class EquationsGeneratorV2:
 
         for i in range(num_unknowns):
             # Choose a variable to repeat in this equation
-            var_to_repeat = random.choice(var_symbols)
+            var_to_repeat = rng.choice(var_symbols)
             var_name = str(var_to_repeat)
 
             # Decide how many times to repeat the variable (2-3 times)
-            repetitions = random.randint(2, 3)
+            repetitions = rng.randint(2, 3)
 
             # Create the left side of the equation with repeated variable
             left_side = repetitions * var_to_repeat
@@ -269,14 +278,14 @@ class EquationsGeneratorV2:
             right_side_value = repetitions * solution_values[var_to_repeat]
 
             # Sometimes mix in other variables (for equations after the first one)
-            if i > 0 and random.random() > 0.3 and num_unknowns > 1:
+            if i > 0 and rng.random() > 0.3 and num_unknowns > 1:
                 # Choose another variable different from the repeated one
                 other_vars = [v for v in var_symbols if v != var_to_repeat]
-                other_var = random.choice(other_vars)
+                other_var = rng.choice(other_vars)
                 other_var_name = str(other_var)
 
                 # Choose an operation (+ or -)
-                operation = random.choice(["+", "-"])
+                operation = rng.choice(["+", "-"])
 
                 if operation == "+":
                     left_side += other_var
@@ -300,16 +309,11 @@ class EquationsGeneratorV2:
             # Convert equations to a matrix form to check linear independence
             A, b = sp.linear_eq_to_matrix(equations, var_symbols)
 
-            # Check if the matrix has full rank (linearly independent equations)
-            if A.rank() < len(var_symbols):
+            # A square system has exactly one solution iff its matrix is nonsingular
+            if A.det() == 0:
                 # If not linearly independent, try again with a different set of equations
-                return self.generate_simple_quiz(num_unknowns, max_value, random_seed)
-
-            # Double-check by solving the system
-            solutions = sp.solve(equations, var_symbols, dict=True)
-            if len(solutions) != 1:
-                # If not exactly one solution, try again
-                return self.generate_simple_quiz(num_unknowns, max_value, random_seed)
+                # Keep drawing from the same generator so a seeded retry gets new equations
+                return self.generate_simple_quiz(num_unknowns, max_value, rng=rng)
 
         # Create equation objects
         equation_objects = [
@@ -331,6 +335,7 @@ class EquationsGeneratorV2:
         max_value: int = 30,
         allow_decimals: bool = False,
         random_seed: int | None = None,
+        rng: random.Random | None = None,
     ) -> DynamicQuizV2:
         """
         Generate grade school equations with multiple unknowns.
@@ -344,6 +349,7 @@ class EquationsGeneratorV2:
             max_value: Maximum value for constants, defaults to 30
             allow_decimals: Whether to allow decimal values, defaults to False
             random_seed: Optional random seed for reproducibility
+            rng: Optional random number generator to draw from, overrides random_seed
 
         Returns:
             DynamicQuizV2: The generated quiz with equations and solution
@@ -352,22 +358,22 @@ class EquationsGeneratorV2:
         if operations is None:
             operations = ["+", "-"]
 
-        # Set random seed if provided
-        if random_seed is not None:
-            random.seed(random_seed)
+        # Use a private generator so seeding never touches the global random state
+        if rng is None:
+            rng = random.Random(random_seed)
 
-        # Create the variable symbols
-        var_symbols = [sp.Symbol(var) for var in self.variables[:num_unknowns]]
+        # Take the variable symbols for the requested number of unknowns
+        var_symbols = self.symbols[:num_unknowns]
 
         # Generate random solutions for each variable
         solution_values = {}
         for _i, var in enumerate(var_symbols):
             if allow_decimals:
                 # Generate a decimal value with one decimal place
-                solution_values[var] = round(random.uniform(1, max_value // 3), 1)
+                solution_values[var] = round(rng.uniform(1, max_value // 3), 1)
             else:
                 # Generate an integer value
-                solution_values[var] = random.randint(1, max_value // 3)
+                solution_values[var] = rng.randint(1, max_value // 3)
 
         # Create human-readable solution dictionary
         human_readable_solution = {str(var): value for var, value in solution_values.items()}
@@ -387,8 +393,8 @@ class EquationsGeneratorV2:
             for _i in range(num_unknowns):
                 # Decide which variables to include in this equation
                 # Always include at least one variable
-                num_vars_to_use = random.randint(1, min(num_unknowns, 3))
-                vars_to_use = random.sample(var_symbols, num_vars_to_use)
+                num_vars_to_use = rng.randint(1, min(num_unknowns, 3))
+                vars_to_use = rng.sample(var_symbols, num_vars_to_use)
 
                 # Build the left side of the equation
                 left_side = 0
@@ -397,7 +403,7 @@ class EquationsGeneratorV2:
                 # Add terms with variables
                 for j, var in enumerate(vars_to_use):
                     # Decide on a coefficient (1-3)
-                    coef = random.randint(1, min(3, max_value // 3))
+                    coef = rng.randint(1, min(3, max_value // 3))
 
                     # For the first term, just add it
                     if j == 0:
@@ -416,7 +422,7 @@ class EquationsGeneratorV2:
                                     formatted_left += f" + {var}"
                     else:
                         # For subsequent terms, choose an operation
-                        operation = random.choice(operations)
+                        operation = rng.choice(operations)
 
                         if operation == "+":
                             if coef == 1:
@@ -458,9 +464,9 @@ class EquationsGeneratorV2:
                                 formatted_left = f"({formatted_left}) / {coef}"
 
                 # Sometimes add a constant term
-                if random.random() > 0.5:
-                    const = random.randint(1, max_value // 3)
-                    operation = random.choice(["+", "-"])
+                if rng.random() > 0.5:
+                    const = rng.randint(1, max_value // 3)
+                    operation = rng.choice(["+", "-"])
 
                     if operation == "+":
                         left_side += const
@@ -476,7 +482,7 @@ class EquationsGeneratorV2:
                 if isinstance(right_side_value, int | float) and abs(right_side_value) > max_value:
                     # Create a new equation with a smaller right side
                     if right_side_value > 0:
-                        new_right_side = random.randint(1, max_value)
+                        new_right_side = rng.randint(1, max_value)
                         # Calculate how much we need to subtract from the left side
                         adjustment = right_side_value - new_right_side
                         left_side -= adjustment
@@ -484,7 +490,7 @@ class EquationsGeneratorV2:
                         right_side_value = new_right_side
                     else:
                         # Create a new equation with a smaller right side
-                        new_right_side = -random.randint(1, max_value)
+                        new_right_side = -rng.randint(1, max_value)
                         # Calculate how much we need to add to the left side
                         adjustment = abs(right_side_value) - abs(new_right_side)
                         left_side += adjustment
@@ -500,22 +506,13 @@ class EquationsGeneratorV2:
                 formatted_equations.append(formatted_equation)
 
             # Verify that the system has exactly one solution
-            if num_unknowns > 1:
-                # Convert equations to a matrix form to check linear independence
-                A, b = sp.linear_eq_to_matrix(equations, var_symbols)
-
-                # Check if the matrix has full rank (linearly independent equations)
-                if A.rank() == len(var_symbols):
-                    # Double-check by solving the system
-                    solutions = sp.solve(equations, var_symbols, dict=True)
-                    if len(solutions) == 1:
-                        # We have a valid system with exactly one solution
-                        break
-            else:
-                # For a single unknown, we just need to check that the equation is solvable
-                solutions = sp.solve(equations, var_symbols, dict=True)
-                if len(solutions) == 1:
-                    break
+            # Convert equations to a matrix form to check linear independence
+            # (for a single unknown this is just a nonzero coefficient check)
+            A, b = sp.linear_eq_to_matrix(equations, var_symbols)
+
+            # A square system has exactly one solution iff its matrix is nonsingular
+            if A.det() != 0:
+                break
 
             attempts += 1
 
@@ -527,8 +524,8 @@ class EquationsGeneratorV2:
 
             for _i, var in enumerate(var_symbols):
                 # Create a simple equation like x + 5 = 10 or 2*y - 3 = 7
-                coef = random.randint(1, min(3, max_value // 3))
-                const = random.randint(1, max_value // 3)
+                coef = rng.randint(1, min(3, max_value // 3))
+                const = rng.randint(1, max_value // 3)
 
                 left_side = coef * var
 
@@ -547,7 +544,7 @@ class EquationsGeneratorV2:
                         for _ in range(coef - 1):
                             formatted_left += f" + {var}"
 
-                if random.random() > 0.5:
+                if rng.random() > 0.5:
                     left_side += const
                     formatted_left += f" + {const}"
                 else:
@@ -561,7 +558,7 @@ class EquationsGeneratorV2:
                 if isinstance(right_side_value, int | float) and abs(right_side_value) > max_value:
                     # Create a new equation with a smaller right side
                     if right_side_value > 0:
-                        new_right_side = random.randint(1, max_value)
+                        new_right_side = rng.randint(1, max_value)
                         # Calculate how much we need to subtract from the left side
                         adjustment = right_side_value - new_right_side
                         left_side -= adjustment
@@ -569,7 +566,7 @@ class EquationsGeneratorV2:
                         right_side_value = new_right_side
                     else:
                         # Create a new equation with a smaller right side
-                        new_right_side = -random.randint(1, max_value)
+                        new_right_side = -rng.randint(1, max_value)
                         # Calculate how much we need to add to the left side
                         adjustment = abs(right_side_value) - abs(new_right_side)
                         left_side += adjustment
@@ -595,7 +592,9 @@ class EquationsGeneratorV2:
             ),
         )
 
-    def generate_equations(self, config: EquationConfig) -> DynamicQuizV2:
+    def generate_equations(
+        self, config: EquationConfig, rng: random.Random | None = None
+    ) -> DynamicQuizV2:
         """
         Generate equations based on a configuration dictionary.
 
@@ -631,6 +630,7 @@ class EquationsGeneratorV2:
                     "allow_decimals": False,  # Optional
                     "random_seed": 12345  # Optional
                 }
+            rng: Optional random number generator to draw from, overrides random_seed
 
         Returns:
             DynamicQuizV2: The generated quiz with equations and solution
@@ -657,12 +657,14 @@ class EquationsGeneratorV2:
                 allow_decimals=config.get("allow_decimals", False),
                 elements=config.get("elements", 2),
                 random_seed=random_seed,
+                rng=rng,
             )
         elif equation_type == "simple_quiz":
             return self.generate_simple_quiz(
                 num_unknowns=config.get("num_unknowns", 2),
                 max_value=config.get("max_value", 20),
                 random_seed=random_seed,
+                rng=rng,
             )
         elif equation_type == "grade_school":
             return self.generate_grade_school(
@@ -671,6 +673,7 @@ class EquationsGeneratorV2:
                 max_value=config.get("max_value", 30),
                 allow_decimals=config.get("allow_decimals", False),
                 random_seed=random_seed,
+                rng=rng,
             )
         else:
             raise ValueError(f"Unknown equation type: {equation_type}")
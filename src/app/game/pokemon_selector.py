@@ -81,23 +81,23 @@ class PokemonSelector:
         """
         eligible_tiers = cls.get_eligible_tiers(player_level)
 
+        # The weight depends only on the tier, so calculate it once per eligible tier
+        tier_weights = {
+            tier: cls.calculate_adjusted_weight(tier, difficulty, player_level)
+            for tier in eligible_tiers
+        }
+
         # Filter Pokémon by eligible tiers
         eligible_pokemon = {
-            name: pokemon for name, pokemon in pokemons.items() if pokemon.tier in eligible_tiers
+            name: pokemon for name, pokemon in pokemons.items() if pokemon.tier in tier_weights
         }
 
         if not eligible_pokemon:
             return []
 
-        # Calculate weights for each eligible Pokémon
-        weights = {
-            name: cls.calculate_adjusted_weight(pokemon.tier, difficulty, player_level)
-            for name, pokemon in eligible_pokemon.items()
-        }
-
-        # Select Pokémon based on weights
-        pokemon_names = list(weights.keys())
-        pokemon_weights = [weights[name] for name in pokemon_names]
+        # Select Pokémon based on their tier weights
+        pokemon_names = list(eligible_pokemon.keys())
+        pokemon_weights = [tier_weights[pokemon.tier] for pokemon in eligible_pokemon.values()]
 
         # Ensure we don't try to select more than available
         count = min(count, len(pokemon_names))
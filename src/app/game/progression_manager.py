@@ -3,6 +3,8 @@ Progression management module.
 Handles XP calculations, level-up logic, and progression-related functionality.
 """
 
+import bisect
+from itertools import accumulate
 from typing import Any
 
 from src.app.game.progression_config import (
@@ -12,6 +14,17 @@ from src.app.game.progression_config import (
     XP_MULTIPLIER,
 )
 
+# Number of levels whose XP requirement is precomputed; higher levels use the formula directly
+_XP_TABLE_LEVELS = 100
+
+# XP needed to advance from each level, indexed by level - 1
+_XP_NEEDED = tuple(
+    int(BASE_XP * (XP_MULTIPLIER ** (level - 1))) for level in range(1, _XP_TABLE_LEVELS + 1)
+)
+
+# Total XP needed to reach each level from level 1, indexed by level - 1
+_CUMULATIVE_XP = tuple(accumulate(_XP_NEEDED, initial=0))
+
 
 class ProgressionManager:
     """
@@ -57,6 +70,8 @@ class ProgressionManager:
         Returns:
             XP needed for next level
         """
+        if 1 <= level <= _XP_TABLE_LEVELS:
+            return _XP_NEEDED[level - 1]
         return int(BASE_XP * (XP_MULTIPLIER ** (level - 1)))
 
     @classmethod
@@ -73,15 +88,19 @@ class ProgressionManager:
         """
         level = current_level
         xp = current_xp
-        leveled_up = False
 
-        # Check for level up
+        # Jump straight to the final level within the table using cumulative XP
+        if 1 <= level <= _XP_TABLE_LEVELS and xp >= _XP_NEEDED[level - 1]:
+            total_xp = _CUMULATIVE_XP[level - 1] + xp
+            level = bisect.bisect_right(_CUMULATIVE_XP, total_xp)
+            xp = total_xp - _CUMULATIVE_XP[level - 1]
+
+        # Check for level up beyond the table
         while xp >= cls.calculate_xp_needed(level):
             xp -= cls.calculate_xp_needed(level)
             level += 1
-            leveled_up = True
 
-        return {"level": level, "xp": xp, "leveled_up": leveled_up}
+        return {"level": level, "xp": xp, "leveled_up": level > current_level}
 
     @classmethod
     def get_level_info(cls, level: int, xp: int) -> dict[str, Any]:
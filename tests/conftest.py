@@ -38,11 +38,11 @@ def test_pokemon_data_path() -> Path:
     return Path("tests/data/pokemons.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def quiz_data(test_data_path, test_pokemon_data_path):
     """
     Fixture providing loaded quiz data.
-    Creates fresh data for each test to avoid state contamination.
+    Uses session scope as tests and GameManager only read the loaded config.
     """
     return load_game_config(test_data_path, test_pokemon_data_path)
 
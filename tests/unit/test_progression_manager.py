@@ -16,6 +16,12 @@ def test_calculate_xp_needed():
     assert ProgressionManager.calculate_xp_needed(2) == int(BASE_XP * XP_MULTIPLIER)
     assert ProgressionManager.calculate_xp_needed(10) == int(BASE_XP * (XP_MULTIPLIER**9))
 
+    # Levels on both sides of the precomputed table edge follow the same formula
+    for level in (100, 101, 150):
+        assert ProgressionManager.calculate_xp_needed(level) == int(
+            BASE_XP * (XP_MULTIPLIER ** (level - 1))
+        )
+
 
 def test_xp_progression_curve():
     """Test the XP progression curve from Level 1 to 50."""
@@ -99,6 +105,13 @@ def test_process_level_up():
     assert result["xp"] == 25
     assert result["leveled_up"] is True
 
+    # Test level ups that run past the precomputed XP table
+    total_xp = sum(int(BASE_XP * (XP_MULTIPLIER ** (level - 1))) for level in range(98, 103)) + 25
+    result = ProgressionManager.process_level_up(98, total_xp)
+    assert result["level"] == 103
+    assert result["xp"] == 25
+    assert result["leveled_up"] is True
+
 
 def test_get_level_info():
     """Test getting level information."""
@@ -19,17 +19,17 @@ from src.app.game.game_config import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_data_path():
     return Path("tests/data/quizzes.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_pokemon_data_path():
     return Path("tests/data/pokemons.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def quiz_data(test_data_path, test_pokemon_data_path):
     return load_game_config(test_data_path, test_pokemon_data_path)
 